@@ -0,0 +1,112 @@
+# alcance.py
+"""
+Alcance de 1º, 2º e 3º grau de todas as pessoas, calculado em lote.
+
+As contagens são obtidas com potências da matriz de adjacência esparsa
+(booleana): para um bloco de origens R, cada salto faz R = R + R·A. Os
+blocos de origens são independentes e são distribuídos entre os núcleos.
+
+Rodado como script, grava as contagens em ARQUIVO_ALCANCE; o carregamento
+do grafo (grafo_dados.carregar_grafo) lê esse arquivo, ou calcula em um
+único processo se ele não existir ou estiver desatualizado, e guarda os
+valores como atributos dos nós (alcance_1, alcance_2, alcance_3).
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy import sparse
+
+ARQUIVO_ALCANCE = 'alcance_cache.json'
+GRAUS = 3
+TAMANHO_BLOCO_ORIGENS = 512
+
+_adjacencia = None
+
+
+def _iniciar_trabalhador(adjacencia):
+    global _adjacencia
+    _adjacencia = adjacencia
+
+
+def _contar_bloco(intervalo, graus=GRAUS):
+    """Contagens cumulativas de alcance (sem contar a origem) para as origens do intervalo."""
+    inicio, fim = intervalo
+    A = _adjacencia
+    alcancados = sparse.identity(A.shape[0], dtype=np.int32, format='csr')[inicio:fim]
+    contagens = np.empty((fim - inicio, graus), dtype=np.int64)
+    for salto in range(graus):
+        alcancados = (alcancados + alcancados @ A).tocsr()
+        alcancados.data[:] = 1  # mantém a matriz booleana (só importa se há caminho)
+        contagens[:, salto] = np.diff(alcancados.indptr) - 1
+    return inicio, contagens
+
+
+def calcular_alcance(G, graus=GRAUS, processos=1):
+    """
+    Devolve {nó: [alcance até 1º grau, até 2º, ...]} para todos os nós.
+
+    `processos` > 1 distribui os blocos de origens entre processos; use
+    None para um processo por núcleo.
+    """
+    ids = list(G.nodes())
+    posicao = {n: i for i, n in enumerate(ids)}
+    linhas, colunas = [], []
+    for u, v in G.edges():
+        if u == v:
+            continue
+        linhas += [posicao[u], posicao[v]]
+        colunas += [posicao[v], posicao[u]]
+    A = sparse.csr_matrix(
+        (np.ones(len(linhas), dtype=np.int32), (linhas, colunas)), shape=(len(ids), len(ids))
+    )
+    A.data[:] = 1  # arestas repetidas (multigrafo) contam uma vez
+
+    intervalos = [(i, min(i + TAMANHO_BLOCO_ORIGENS, len(ids))) for i in range(0, len(ids), TAMANHO_BLOCO_ORIGENS)]
+    contagens = np.zeros((len(ids), graus), dtype=np.int64)
+    if processos == 1 or len(intervalos) == 1:
+        _iniciar_trabalhador(A)
+        resultados = (_contar_bloco(intervalo, graus) for intervalo in intervalos)
+        for inicio, bloco in resultados:
+            contagens[inicio:inicio + len(bloco)] = bloco
+    else:
+        with ProcessPoolExecutor(max_workers=processos, initializer=_iniciar_trabalhador, initargs=(A,)) as executor:
+            for inicio, bloco in executor.map(_contar_bloco, intervalos, [graus] * len(intervalos)):
+                contagens[inicio:inicio + len(bloco)] = bloco
+
+    return {n: contagens[i].tolist() for i, n in enumerate(ids)}
+
+
+def anotar_alcance(G, gexf_file_path, arquivo_alcance=ARQUIVO_ALCANCE):
+    """Grava alcance_1..alcance_3 nos nós, usando o arquivo do lote quando ele estiver atualizado."""
+    alcance = None
+    if os.path.exists(arquivo_alcance) and os.path.getmtime(arquivo_alcance) >= os.path.getmtime(gexf_file_path):
+        with open(arquivo_alcance, encoding='utf-8') as f:
+            alcance = json.load(f)
+        if set(alcance) != set(G.nodes()):
+            alcance = None
+    if alcance is None:
+        alcance = calcular_alcance(G)
+
+    for n, contagens in alcance.items():
+        for grau, valor in enumerate(contagens, start=1):
+            G.nodes[n][f'alcance_{grau}'] = valor
+    return G
+
+
+if __name__ == '__main__':
+    import time
+
+    import networkx as nx
+
+    from grafo_dados import GEXF_FILE_PATH
+
+    inicio = time.perf_counter()
+    grafo = nx.read_gexf(GEXF_FILE_PATH)
+    resultado = calcular_alcance(grafo, processos=None)
+    with open(ARQUIVO_ALCANCE, 'w', encoding='utf-8') as f:
+        json.dump(resultado, f)
+    print(f"Alcance de {len(resultado)} nós gravado em {ARQUIVO_ALCANCE} "
+          f"({time.perf_counter() - inicio:.2f} s, {os.cpu_count()} núcleos)")
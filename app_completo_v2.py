@@ -2,14 +2,22 @@
 import dash
 from dash import dcc, html, Input, Output
 import dash_bootstrap_components as dbc
-import networkx as nx
 import plotly.graph_objects as go
 
-# Carregar grafo
-G = nx.read_gexf("Grafo_Para_App_Dash.gexf")
-pos = nx.spring_layout(G, seed=42, k=0.5, weight='weight')
+from grafo_dados import carregar_grafo, carregar_layout
+from indices_centralidade import carregar_indice_centralidade
+from similaridade import carregar_indice_similaridade
+from temporal_grafo import carregar_indice_temporal
+
+# Carregar grafo (com alcance de 1º/2º/3º grau já calculado nos nós), layout e índices;
+# com snapshot_grafo.pkl atualizado tudo vem do snapshot (python snapshot_grafo.py)
+G = carregar_grafo()
+pos = carregar_layout()
 nodes = list(G.nodes(data=True))
-edges = list(G.edges(data=True))
+indice_temporal = carregar_indice_temporal()
+anos_coorte = indice_temporal.anos
+indice_similaridade = carregar_indice_similaridade()
+indice_centralidade = carregar_indice_centralidade()
 
 
 
@@ -51,6 +59,18 @@ app.layout = dbc.Container([
             dcc.Dropdown([{"label": p, "value": p} for p in projetos], id="projeto_nome", multi=True),
             html.Label("Rede"),
             dcc.Dropdown([{"label": t, "value": t} for t in tipos], id="tipo", multi=True),
+            # Sem projetos com ano o slider fica oculto e o grafo é mostrado completo (valor None)
+            html.Div([
+                html.Label("Coorte (até o ano)"),
+                dcc.Slider(
+                    id="ano_coorte",
+                    min=anos_coorte[0] if anos_coorte else 0,
+                    max=anos_coorte[-1] if anos_coorte else 0,
+                    step=None,
+                    marks={a: str(a) for a in anos_coorte},
+                    value=anos_coorte[-1] if anos_coorte else None
+                )
+            ], style={} if anos_coorte else {"display": "none"}),
             html.Div(id="painel-conexoes", className="mt-4")
         ], width=3),
         dbc.Col([
@@ -65,11 +85,15 @@ app.layout = dbc.Container([
     Input("nome", "value"),
     Input("projeto_nome", "value"),
     Input("tipo", "value"),
-    Input("logica_filtros", "value")
+    Input("logica_filtros", "value"),
+    Input("ano_coorte", "value")
 )
-def atualizar_grafo(nome, projeto_nome, tipo, logica_filtros):
+def atualizar_grafo(nome, projeto_nome, tipo, logica_filtros, ano_coorte):
+    nos_ativos, arestas_ativas = indice_temporal.fatia(ano_coorte)
     todos_nos_validos = []
     for node, data in G.nodes(data=True):
+        if node not in nos_ativos:
+            continue
         cond_tipo = not tipo or any(t in data.get("Tipos", "") for t in tipo)
         if logica_filtros == "AND":
             if cond_tipo:
@@ -106,7 +130,7 @@ def atualizar_grafo(nome, projeto_nome, tipo, logica_filtros):
 
     node_x, node_y, size, text, color, customdata = [], [], [], [], [], []
     edge_x, edge_y = [], []
-    for u, v, _ in edges:
+    for u, v in arestas_ativas:
         if u in todos_nos_validos and v in todos_nos_validos:
             x0, y0 = pos[u]
             x1, y1 = pos[v]
@@ -143,21 +167,26 @@ def atualizar_grafo(nome, projeto_nome, tipo, logica_filtros):
     if nome and len(nome) == 1:
         pessoa = next((n for n, d in G.nodes(data=True) if d['nome'] == nome[0]), None)
         if pessoa:
-            n1 = set(G.neighbors(pessoa))
-            n2 = set().union(*(G.neighbors(n) for n in n1)) - n1 - {pessoa}
-            n3 = set().union(*(G.neighbors(n) for n in n2)) - n2 - n1 - {pessoa}
             painel = dbc.Card([
                 dbc.CardHeader("📋 Resumo da Pessoa Selecionada", className="fw-bold text-primary"),
                 dbc.CardBody([
                     html.Div([
                         html.P(["📂 Projetos: ", html.Span(f"{len(G.nodes[pessoa].get('Projetos', '').split(';'))}", className="badge bg-info text-dark")]),
                         html.P(["📊 Centralidade de Grau: ", html.Span(f"#{G.nodes[pessoa].get('ranking_grau', 'N/A')}", className="badge bg-secondary")]),
-                        html.P(["🧭 Intermediação: ", html.Span(f"#{G.nodes[pessoa].get('ranking_intermediacao', 'N/A')}", className="badge bg-secondary")])
+                        html.P(["🧭 Intermediação: ", html.Span(f"#{G.nodes[pessoa].get('ranking_intermediacao', 'N/A')}", className="badge bg-secondary")]),
+                        html.P(["📈 Percentil de intermediação: ", html.Span(f"{indice_centralidade.percentil(pessoa, 'intermediacao'):.0f}%", className="badge bg-secondary")])
+                    ], className="mb-3"),
+                    html.Div([
+                        html.P(["🔁 Até 1º grau: ", html.Span(f"{G.nodes[pessoa]['alcance_1']}", className="badge bg-success")]),
+                        html.P(["🔁 Até 2º grau: ", html.Span(f"{G.nodes[pessoa]['alcance_2']}", className="badge bg-success")]),
+                        html.P(["🔁 Até 3º grau: ", html.Span(f"{G.nodes[pessoa]['alcance_3']}", className="badge bg-success")])
                     ], className="mb-3"),
                     html.Div([
-                        html.P(["🔁 Até 1º grau: ", html.Span(f"{len(n1)}", className="badge bg-success")]),
-                        html.P(["🔁 Até 2º grau: ", html.Span(f"{len(n1 | n2)}", className="badge bg-success")]),
-                        html.P(["🔁 Até 3º grau: ", html.Span(f"{len(n1 | n2 | n3)}", className="badge bg-success")])
+                        html.P("🤝 Líderes similares:", className="mb-1"),
+                        html.Ul([
+                            html.Li(f"{s['nome']} ({s['jaccard']:.0%})")
+                            for s in indice_similaridade.similares(pessoa, 10)
+                        ], className="small")
                     ])
                 ])
             ], className="mt-3 shadow-sm")
@@ -12,9 +12,6 @@ com:
 from pathlib import Path
 import json
 import networkx as nx
-import matplotlib
-from matplotlib import cm
-from matplotlib import colors as mcolors
 
 # -------------------------
 INPUT_GEXF = "Grafo_Para_App_Dash.gexf"  # ajuste se necessário
@@ -22,6 +19,12 @@ OUTPUT_HTML = "graph_visjs_with_legend.html"
 MAX_LABEL_CHARS = 80
 BASE_NODE_SIZE = 10
 SIZE_SCALE = 2
+# Paleta "tab20" do matplotlib, fixa aqui para não importar o matplotlib só por ela
+TAB20 = [
+    "#1f77b4", "#aec7e8", "#ff7f0e", "#ffbb78", "#2ca02c", "#98df8a", "#d62728", "#ff9896",
+    "#9467bd", "#c5b0d5", "#8c564b", "#c49c94", "#e377c2", "#f7b6d2", "#7f7f7f", "#c7c7c7",
+    "#bcbd22", "#dbdb8d", "#17becf", "#9edae5",
+]
 # -------------------------
 
 gpath = Path(INPUT_GEXF)
@@ -42,24 +45,10 @@ for n, data in H.nodes(data=True):
     labels.append(nome)
 unique_labels = sorted(set(labels))
 
-# pegar colormap de forma compatível com versões do matplotlib
-try:
-    cmap = matplotlib.colormaps.get_cmap("tab20")
-    cmap_n = cmap.colors if hasattr(cmap, "colors") else None
-except Exception:
-    cmap = cm.get_cmap("tab20")
-    cmap_n = None
-
 label_to_color = {}
 for i, lab in enumerate(unique_labels):
-    # usa índice ciclando pelo colormap
-    try:
-        col = mcolors.to_hex(cmap(i % (getattr(cmap, "N", 20))))
-    except Exception:
-        # fallback simples
-        rgba = cmap(i % 20)
-        col = mcolors.to_hex(rgba)
-    label_to_color[lab] = col
+    # usa índice ciclando pela paleta
+    label_to_color[lab] = TAB20[i % len(TAB20)]
 
 # montar nodes e edges para vis.js
 nodes = []
@@ -0,0 +1,47 @@
+# benchmark_similares.py
+"""
+Compara a busca de líderes similares do índice MinHash/LSH com a força bruta:
+ - recall@k (fração dos k mais similares exatos que o LSH também devolve)
+ - tempo de montagem do índice
+ - tempo médio por consulta em cada abordagem
+"""
+
+import time
+
+from grafo_dados import carregar_grafo
+from similaridade import IndiceSimilaridade
+
+# -------------------------
+K = 10
+# -------------------------
+
+G = carregar_grafo()
+
+inicio = time.perf_counter()
+indice = IndiceSimilaridade(G)
+tempo_indice = time.perf_counter() - inicio
+
+pessoas = list(indice.assinaturas)
+recalls = []
+tempo_lsh = 0.0
+tempo_bruta = 0.0
+for n in pessoas:
+    inicio = time.perf_counter()
+    aproximado = indice.similares(n, K)
+    tempo_lsh += time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    exato = indice.similares_forca_bruta(n, K)
+    tempo_bruta += time.perf_counter() - inicio
+
+    if exato:
+        # Empates no Jaccard da k-ésima posição contam como acerto
+        corte = exato[-1]['jaccard']
+        acertos = sum(1 for r in aproximado if r['jaccard'] >= corte)
+        recalls.append(min(acertos, len(exato)) / len(exato))
+
+print(f"Pessoas indexadas: {len(pessoas)}")
+print(f"Montagem do índice: {tempo_indice * 1000:.1f} ms")
+print(f"Recall@{K} médio: {sum(recalls) / len(recalls):.3f}")
+print(f"Consulta LSH: {tempo_lsh / len(pessoas) * 1000:.3f} ms")
+print(f"Consulta força bruta: {tempo_bruta / len(pessoas) * 1000:.3f} ms")
@@ -0,0 +1,167 @@
+"""
+Carregamento compartilhado do grafo e filtros no mesmo formato do app Dash.
+
+Os servidores Flask e o app Dash leem o mesmo GEXF; este módulo mantém
+uma única cópia carregada em memória por processo e expõe os filtros
+(nome, Projetos, Tipos, lógica AND/OR) usados pelas rotas de consulta.
+
+Se existir um snapshot de inicialização (gerado por snapshot_grafo.py)
+mais novo que o GEXF, o grafo, os índices e o layout saem dele, sem
+reler o GEXF nem recalcular nada. NetworkX e o cálculo de alcance só são
+importados quando for preciso montar o grafo do zero.
+"""
+
+import os
+import pickle
+from functools import lru_cache
+
+GEXF_FILE_PATH = 'Grafo_Para_App_Dash.gexf'
+ARQUIVO_SNAPSHOT = 'snapshot_grafo.pkl'
+# Incremente ao mudar as classes de índice, METRICAS ou o cálculo de alcance:
+# snapshots gravados com outra versão são ignorados e o grafo é montado do zero
+VERSAO_SNAPSHOT = 1
+
+
+def snapshot_desativado():
+    """True quando GRAFO_SEM_SNAPSHOT vale 1/true/sim (0, vazio ou ausente mantêm o snapshot)."""
+    return os.environ.get('GRAFO_SEM_SNAPSHOT', '').strip().lower() in ('1', 'true', 'sim')
+
+
+@lru_cache(maxsize=1)
+def _snapshot():
+    """Lê o snapshot uma única vez por processo (chave de cache única para todos os carregadores)."""
+    if snapshot_desativado():
+        return None
+    if not os.path.exists(ARQUIVO_SNAPSHOT) or not os.path.exists(GEXF_FILE_PATH):
+        return None
+    if os.path.getmtime(ARQUIVO_SNAPSHOT) < os.path.getmtime(GEXF_FILE_PATH):
+        return None
+    try:
+        with open(ARQUIVO_SNAPSHOT, 'rb') as f:
+            snapshot = pickle.load(f)
+    except (pickle.UnpicklingError, AttributeError, ImportError, EOFError):
+        # Snapshot de uma versão do código que não existe mais
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get('versao') != VERSAO_SNAPSHOT:
+        return None
+    if snapshot.get('gexf_file_path') != GEXF_FILE_PATH:
+        return None
+    return snapshot
+
+
+def ler_snapshot(gexf_file_path=GEXF_FILE_PATH):
+    """
+    Snapshot de inicialização do GEXF informado, ou None se não existir,
+    estiver desatualizado, for de outro GEXF ou de outra VERSAO_SNAPSHOT,
+    ou se GRAFO_SEM_SNAPSHOT=1.
+    """
+    if gexf_file_path != GEXF_FILE_PATH:
+        return None
+    return _snapshot()
+
+
+def ler_grafo(gexf_file_path=GEXF_FILE_PATH):
+    """Lê o GEXF e calcula o alcance de cada nó, sem passar pelo snapshot."""
+    import networkx as nx
+    from alcance import anotar_alcance
+
+    G = nx.read_gexf(gexf_file_path)
+    return anotar_alcance(G, gexf_file_path)
+
+
+@lru_cache(maxsize=1)
+def carregar_grafo(gexf_file_path=GEXF_FILE_PATH):
+    """Devolve o grafo em cache (uma leitura por processo), já com o alcance de cada nó."""
+    snapshot = ler_snapshot(gexf_file_path)
+    if snapshot is not None:
+        return snapshot['grafo']
+    return ler_grafo(gexf_file_path)
+
+
+def calcular_layout(G):
+    """Posições dos nós usadas no app Dash."""
+    import networkx as nx
+
+    return nx.spring_layout(G, seed=42, k=0.5, weight='weight')
+
+
+@lru_cache(maxsize=1)
+def carregar_layout():
+    """Layout do grafo em cache, vindo do snapshot quando houver."""
+    snapshot = ler_snapshot()
+    if snapshot is not None:
+        return snapshot['layout']
+    return calcular_layout(carregar_grafo())
+
+
+def separar_lista(valor):
+    """Quebra um atributo do tipo 'A; B; C' em uma lista sem espaços."""
+    return [v.strip() for v in str(valor or '').split(';') if v.strip()]
+
+
+def ler_lista_parametro(args, chave):
+    """Aceita tanto ?chave=a&chave=b quanto ?chave=a;b na query string."""
+    valores = []
+    for valor in args.getlist(chave):
+        valores.extend(separar_lista(valor))
+    return valores
+
+
+def nos_por_nome(G, nomes):
+    """Devolve os códigos dos nós cujo atributo 'nome' está em `nomes`."""
+    alvo = set(nomes or [])
+    return [n for n, d in G.nodes(data=True) if d.get('nome') in alvo]
+
+
+def vizinhanca(G, origens, graus):
+    """Nós alcançáveis a partir de `origens` em até `graus` saltos (inclusive as origens)."""
+    visitados = set(origens)
+    fronteira = set(origens)
+    for _ in range(graus):
+        proxima = set()
+        for n in fronteira:
+            proxima.update(G.neighbors(n))
+        fronteira = proxima - visitados
+        if not fronteira:
+            break
+        visitados |= fronteira
+    return visitados
+
+
+def filtrar_nos(G, nome=None, projeto_nome=None, tipo=None, logica_filtros='AND', graus=3):
+    """
+    Seleciona os nós do subgrafo com os mesmos filtros do app Dash.
+
+    Projetos e Tipos são comparados item a item (valor exato), não por trecho do texto.
+
+    - tipo: restringe aos nós com algum dos Tipos informados (sempre aplicado);
+    - nome: nós até `graus` saltos das pessoas selecionadas;
+    - projeto_nome: nós que participaram de algum dos projetos informados.
+
+    Com 'AND' o nó precisa atender a nome e projeto (quando informados);
+    com 'OR' basta atender a um deles.
+    """
+    tipo = set(tipo or [])
+    validos = [
+        n for n, d in G.nodes(data=True)
+        if not tipo or tipo.intersection(separar_lista(d.get('Tipos', '')))
+    ]
+
+    condicoes = []
+    if nome:
+        condicoes.append(vizinhanca(G, nos_por_nome(G, nome), graus))
+    if projeto_nome:
+        projeto_nome = set(projeto_nome)
+        condicoes.append({
+            n for n, d in G.nodes(data=True)
+            if projeto_nome.intersection(separar_lista(d.get('Projetos', '')))
+        })
+
+    if not condicoes:
+        return set(validos)
+
+    if logica_filtros == 'OR':
+        selecionados = set().union(*condicoes)
+    else:
+        selecionados = set.intersection(*condicoes)
+    return {n for n in validos if n in selecionados}
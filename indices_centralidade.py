@@ -0,0 +1,125 @@
+"""
+Consultas de top-k e percentil sobre as métricas de centralidade.
+
+Para cada métrica o índice guarda, já no carregamento, a ordem
+decrescente dos nós e os valores ordenados de forma crescente, tanto para
+o grafo inteiro quanto para cada Tipo (rede) e cada grupo. Um top-k vira
+um fatiamento e um percentil vira uma busca binária, sem ordenar nada
+durante a requisição.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from grafo_dados import carregar_grafo, ler_snapshot, separar_lista
+
+# grau = quantidade de conexões diretas (alcance de 1º grau);
+# alcance_2/alcance_3 = pessoas alcançáveis em até 2/3 saltos (ver alcance.py)
+METRICAS = ('grau_ponderado', 'intermediacao', 'grau', 'alcance_2', 'alcance_3')
+
+
+def _valor_float(data, chave):
+    try:
+        return float(data.get(chave, 0))
+    except (ValueError, TypeError):
+        return 0.0
+
+
+class IndiceCentralidade:
+    """Índices ordenados por métrica, para o grafo todo e por Tipo/grupo."""
+
+    def __init__(self, G, metricas=METRICAS):
+        self.G = G
+        self.ids = np.array(list(G.nodes()), dtype=object)
+        self.posicao = {n: i for i, n in enumerate(self.ids)}
+
+        self.valores = {}
+        for metrica in metricas:
+            if metrica == 'grau':
+                self.valores[metrica] = np.array([G.degree(n) for n in self.ids], dtype=float)
+            else:
+                self.valores[metrica] = np.array(
+                    [_valor_float(G.nodes[n], metrica) for n in self.ids], dtype=float
+                )
+
+        # Conjuntos de nós (máscaras booleanas) por Tipo e por grupo
+        self.tipos_do_no = {n: separar_lista(d.get('Tipos', '')) for n, d in G.nodes(data=True)}
+        self.grupo_do_no = {n: d.get('grupo', 'N/A') for n, d in G.nodes(data=True)}
+        self.mascaras = {('todos', None): np.ones(len(self.ids), dtype=bool)}
+        for i, n in enumerate(self.ids):
+            for tipo in self.tipos_do_no[n]:
+                self.mascaras.setdefault(('tipo', tipo), np.zeros(len(self.ids), dtype=bool))[i] = True
+            self.mascaras.setdefault(('grupo', self.grupo_do_no[n]), np.zeros(len(self.ids), dtype=bool))[i] = True
+
+        # ordem[(métrica, filtro)]: posições em ordem decrescente (empate pelo id)
+        # ordenados[(métrica, filtro)]: valores em ordem crescente, para a busca binária
+        self.ordem = {}
+        self.ordenados = {}
+        desempate = np.argsort(self.ids.astype(str), kind='stable')
+        for metrica, valores in self.valores.items():
+            global_desc = desempate[np.argsort(-valores[desempate], kind='stable')]
+            for filtro, mascara in self.mascaras.items():
+                ordem = global_desc[mascara[global_desc]]
+                self.ordem[(metrica, filtro)] = ordem
+                self.ordenados[(metrica, filtro)] = valores[ordem][::-1].copy()
+
+    def _filtro(self, tipo=None, grupo=None):
+        if tipo and grupo:
+            raise ValueError('Informe apenas um filtro: tipo ou grupo.')
+        if tipo:
+            filtro = ('tipo', tipo)
+        elif grupo:
+            filtro = ('grupo', grupo)
+        else:
+            filtro = ('todos', None)
+        if filtro not in self.mascaras:
+            raise KeyError(filtro[1])
+        return filtro
+
+    def top(self, metrica, k=20, tipo=None, grupo=None):
+        """Os `k` nós com maior valor da métrica, opcionalmente dentro de um Tipo ou grupo."""
+        if metrica not in self.valores:
+            raise ValueError(f'Métrica desconhecida: {metrica}')
+        ordem = self.ordem[(metrica, self._filtro(tipo, grupo))][:max(k, 0)]
+        valores = self.valores[metrica]
+        return [
+            {
+                'posicao': i + 1,
+                'id': self.ids[p],
+                'nome': self.G.nodes[self.ids[p]].get('nome', self.ids[p]),
+                metrica: float(valores[p])
+            }
+            for i, p in enumerate(ordem)
+        ]
+
+    def percentil(self, node_id, metrica, tipo=None, grupo=None):
+        """Percentual de nós do recorte com valor menor ou igual ao de `node_id`."""
+        valor = self.valores[metrica][self.posicao[node_id]]
+        ordenados = self.ordenados[(metrica, self._filtro(tipo, grupo))]
+        return float(np.searchsorted(ordenados, valor, side='right') / len(ordenados) * 100)
+
+    def percentis_do_no(self, node_id, metricas=None):
+        """Percentis de `node_id` no grafo todo, em cada um dos seus Tipos e no seu grupo."""
+        if node_id not in self.posicao:
+            raise KeyError(node_id)
+        resultado = {}
+        for metrica in metricas or self.valores:
+            if metrica not in self.valores:
+                raise ValueError(f'Métrica desconhecida: {metrica}')
+            resultado[metrica] = {
+                'valor': float(self.valores[metrica][self.posicao[node_id]]),
+                'geral': self.percentil(node_id, metrica),
+                'tipos': {t: self.percentil(node_id, metrica, tipo=t) for t in self.tipos_do_no[node_id]},
+                'grupo': {self.grupo_do_no[node_id]: self.percentil(node_id, metrica, grupo=self.grupo_do_no[node_id])}
+            }
+        return resultado
+
+
+@lru_cache(maxsize=1)
+def carregar_indice_centralidade():
+    """Índice de centralidade do grafo em cache, montado uma vez por processo."""
+    snapshot = ler_snapshot()
+    if snapshot is not None:
+        return snapshot['indice_centralidade']
+    return IndiceCentralidade(carregar_grafo())
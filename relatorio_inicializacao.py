@@ -0,0 +1,62 @@
+# relatorio_inicializacao.py
+"""
+Relatório de tempo de inicialização de cada ponto de entrada:
+ - tempo de importação do módulo
+ - tempo até a primeira resposta (desde o início da importação)
+
+Cada medição roda em um processo Python novo, como num deploy. Com
+--sem-snapshot o snapshot_grafo.pkl é ignorado (GRAFO_SEM_SNAPSHOT=1),
+para comparar os dois modos de inicialização.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+# (módulo, expressão que devolve o cliente de teste, rota da primeira resposta)
+PONTOS_DE_ENTRADA = [
+    ('servidor_grafo', 'modulo.app.test_client()', '/data'),
+    ('servidor_grafo_com_oauth', 'modulo.app.test_client()', '/data'),
+    ('app_completo_v2', 'modulo.app.server.test_client()', '/'),
+]
+
+CODIGO_MEDICAO = '''
+import json, time
+inicio = time.perf_counter()
+import {modulo} as modulo
+importado = time.perf_counter()
+resposta = {cliente}.get({rota!r})
+fim = time.perf_counter()
+print(json.dumps({{
+    'importacao': importado - inicio,
+    'primeira_resposta': fim - inicio,
+    'status': resposta.status_code
+}}))
+'''
+
+
+def medir(modulo, cliente, rota, usar_snapshot=True):
+    """Roda a medição em um processo novo e devolve o dicionário com os tempos."""
+    codigo = CODIGO_MEDICAO.format(modulo=modulo, cliente=cliente, rota=rota)
+    ambiente = dict(os.environ)
+    if not usar_snapshot:
+        ambiente['GRAFO_SEM_SNAPSHOT'] = '1'
+    processo = subprocess.run([sys.executable, '-c', codigo], capture_output=True, text=True, env=ambiente)
+    if processo.returncode != 0:
+        erro = processo.stderr.strip().splitlines()
+        return {'erro': erro[-1] if erro else f'código de saída {processo.returncode}'}
+    return json.loads(processo.stdout.strip().splitlines()[-1])
+
+
+if __name__ == '__main__':
+    usar_snapshot = '--sem-snapshot' not in sys.argv
+    print(f"Modo: {'com' if usar_snapshot else 'sem'} snapshot")
+    print(f"{'Ponto de entrada':<28}{'Importação':>12}{'1ª resposta':>14}  Rota")
+    for modulo, cliente, rota in PONTOS_DE_ENTRADA:
+        resultado = medir(modulo, cliente, rota, usar_snapshot)
+        if 'erro' in resultado:
+            print(f"{modulo:<28}{'falhou':>12}{'':>14}  {resultado['erro']}")
+        else:
+            print(f"{modulo:<28}{resultado['importacao']:>11.2f}s{resultado['primeira_resposta']:>13.2f}s"
+                  f"  {rota} ({resultado['status']})")
@@ -1,7 +1,13 @@
-import networkx as nx
-from flask import Flask, jsonify, request, redirect, session, url_for, render_template
+from functools import lru_cache
+
+from flask import Flask, jsonify, request, redirect, session, url_for, render_template, Response, stream_with_context
 from flask_cors import CORS
-import pandas as pd
+
+from grafo_dados import GEXF_FILE_PATH, carregar_grafo, filtrar_nos, ler_lista_parametro
+from temporal_grafo import carregar_indice_temporal
+from exportacao_grafo import FORMATOS, gerar_exportacao
+from indices_centralidade import carregar_indice_centralidade
+from similaridade import carregar_indice_similaridade
 
 app = Flask(__name__)
 CORS(app)
@@ -25,78 +31,199 @@ ATTRIBUTE_MAP = {
 # sobre os itens diretamente. Para este caso, vamos simplificar.
 # A melhor abordagem é simplesmente usar os títulos diretamente no código.
 
+@lru_cache(maxsize=None)
+def montar_dados_grafo(ate=None):
+    """Converte a fatia do grafo até o ano `ate` (None = completo) para o formato do vis.js, em cache por ano."""
+    G = carregar_grafo()
+    nos_ativos, arestas_ativas = carregar_indice_temporal().fatia(ate)
+
+    nodes = []
+    for node_id, data in G.nodes(data=True):
+        if node_id not in nos_ativos:
+            continue
+
+        # Garante que os valores numéricos são do tipo correto e evita erros
+        try:
+            grau_ponderado = float(data.get('grau_ponderado', 0))
+            intermediacao = float(data.get('intermediacao', 0))
+            ranking_grau = int(data.get('ranking_grau', 0))
+            ranking_intermediacao = int(data.get('ranking_intermediacao', 0))
+        except (ValueError, TypeError):
+            # Caso a conversão falhe, define valores padrão
+            grau_ponderado = 0
+            intermediacao = 0
+            ranking_grau = 0
+            ranking_intermediacao = 0
+
+        # Prepara o título do nó para o tooltip
+        title = f"Nome: {data.get('nome', 'N/A')}<br/>" \
+                f"Grau Ponderado: {grau_ponderado}<br/>" \
+                f"Intermediação: {intermediacao}<br/>" \
+                f"Ranking Grau: #{ranking_grau}<br/>" \
+                f"Ranking Intermediação: #{ranking_intermediacao}"
+
+        node = {
+            'id': node_id,
+            'nome': data.get('nome', node_id),
+            'title': title,
+            'size': 15,
+            'color': '#73A5D5',
+            'font': {'size': 12},
+            'grau_ponderado': grau_ponderado,
+            'intermediacao': intermediacao,
+            'ranking_grau': ranking_grau,
+            'ranking_intermediacao': ranking_intermediacao,
+            'grupo': data.get('grupo', 'N/A'),
+            'Projetos': data.get('Projetos', 'N/A'),
+            'Tipos': data.get('Tipos', 'N/A'),
+            'Codigos_Projetos': data.get('Codigos_Projetos', 'N/A'),
+            'alcance_1': data.get('alcance_1', 0),
+            'alcance_2': data.get('alcance_2', 0),
+            'alcance_3': data.get('alcance_3', 0)
+        }
+        nodes.append(node)
+
+    edges = []
+    for u, v in arestas_ativas:
+        edge = {
+            'from': u,
+            'to': v,
+            'weight': float(G.edges[u, v].get('weight', 1)),
+            'color': '#999999'
+        }
+        edges.append(edge)
+
+    return {'nodes': nodes, 'edges': edges}
+
 @app.route('/data', methods=['GET'])
 def get_graph_data():
-    """Lê o arquivo GEXF, converte para JSON e retorna os dados."""
-    gexf_file_path = 'Grafo_Para_App_Dash.gexf'
+    """Retorna os dados do grafo em JSON; ?ate=<ano> limita à fatia cumulativa até o ano."""
+    ate = request.args.get('ate')
+    if ate is not None:
+        try:
+            ate = int(ate)
+        except ValueError:
+            return jsonify({'error': 'O parâmetro ate deve ser um ano (número inteiro).'}), 400
     try:
-        # Carrega o grafo do arquivo GEXF
-        G = nx.read_gexf(gexf_file_path)
-
-        nodes = []
-        for node_id, data in G.nodes(data=True):
-            
-            # Garante que os valores numéricos são do tipo correto e evita erros
-            try:
-                grau_ponderado = float(data.get('grau_ponderado', 0))
-                intermediacao = float(data.get('intermediacao', 0))
-                ranking_grau = int(data.get('ranking_grau', 0))
-                ranking_intermediacao = int(data.get('ranking_intermediacao', 0))
-            except (ValueError, TypeError):
-                # Caso a conversão falhe, define valores padrão
-                grau_ponderado = 0
-                intermediacao = 0
-                ranking_grau = 0
-                ranking_intermediacao = 0
-
-            # Prepara o título do nó para o tooltip
-            title = f"Nome: {data.get('nome', 'N/A')}<br/>" \
-                    f"Grau Ponderado: {grau_ponderado}<br/>" \
-                    f"Intermediação: {intermediacao}<br/>" \
-                    f"Ranking Grau: #{ranking_grau}<br/>" \
-                    f"Ranking Intermediação: #{ranking_intermediacao}"
-            
-            node = {
-                'id': node_id,
-                'nome': data.get('nome', node_id),
-                'title': title,
-                'size': 15,
-                'color': '#73A5D5',
-                'font': {'size': 12},
-                'grau_ponderado': grau_ponderado,
-                'intermediacao': intermediacao,
-                'ranking_grau': ranking_grau,
-                'ranking_intermediacao': ranking_intermediacao,
-                'grupo': data.get('grupo', 'N/A'),
-                'Projetos': data.get('Projetos', 'N/A'),
-                'Tipos': data.get('Tipos', 'N/A'),
-                'Codigos_Projetos': data.get('Codigos_Projetos', 'N/A')
-            }
-            nodes.append(node)
-
-        edges = []
-        for u, v, data in G.edges(data=True):
-            edge = {
-                'from': u,
-                'to': v,
-                'weight': float(data.get('weight', 1)),
-                'color': '#999999'
-            }
-            edges.append(edge)
-
-        return jsonify({'nodes': nodes, 'edges': edges})
+        # Normaliza o ano para o último ano do índice, para que anos equivalentes dividam o mesmo cache
+        ate = carregar_indice_temporal().ano_efetivo(ate)
+        return jsonify(montar_dados_grafo(ate))
 
     except FileNotFoundError:
-        return jsonify({'error': f'Arquivo {gexf_file_path} não encontrado.'}), 404
+        return jsonify({'error': f'Arquivo {GEXF_FILE_PATH} não encontrado.'}), 404
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/linha_do_tempo', methods=['GET'])
+def linha_do_tempo():
+    """Evolução cumulativa por ano: nós, arestas, densidade e maiores intermediações."""
+    try:
+        return jsonify(carregar_indice_temporal().linha_do_tempo())
+    except FileNotFoundError:
+        return jsonify({'error': f'Arquivo {GEXF_FILE_PATH} não encontrado.'}), 404
+
+@app.route('/exportar', methods=['GET'])
+def exportar_subgrafo():
+    """
+    Exporta em streaming o subgrafo filtrado (mesmos filtros do app Dash).
+
+    Parâmetros: nome, projeto_nome, tipo (repetidos ou separados por ';'),
+    logica (AND/OR), graus (saltos a partir de 'nome', padrão 3),
+    formato (gexf, graphml ou csv) e tabela (arestas ou nos, só no csv).
+    """
+    formato = request.args.get('formato', 'gexf').lower()
+    tabela = request.args.get('tabela', 'arestas').lower()
+    if formato not in FORMATOS:
+        return jsonify({'error': f'Formato inválido: {formato}. Use gexf, graphml ou csv.'}), 400
+    if tabela not in ('arestas', 'nos'):
+        return jsonify({'error': f'Tabela inválida: {tabela}. Use arestas ou nos.'}), 400
+    try:
+        graus = int(request.args.get('graus', 3))
+    except ValueError:
+        return jsonify({'error': 'O parâmetro graus deve ser um número inteiro.'}), 400
+
+    try:
+        G = carregar_grafo()
+    except FileNotFoundError:
+        return jsonify({'error': 'Arquivo do grafo não encontrado.'}), 404
+
+    nos = filtrar_nos(
+        G,
+        nome=ler_lista_parametro(request.args, 'nome'),
+        projeto_nome=ler_lista_parametro(request.args, 'projeto_nome'),
+        tipo=ler_lista_parametro(request.args, 'tipo'),
+        logica_filtros=request.args.get('logica', 'AND').upper(),
+        graus=graus
+    )
+
+    mimetype, extensao = FORMATOS[formato]
+    nome_arquivo = f'subgrafo_{tabela}.{extensao}' if formato == 'csv' else f'subgrafo.{extensao}'
+    return Response(
+        stream_with_context(gerar_exportacao(G, nos, formato, tabela)),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename={nome_arquivo}'}
+    )
+
+@app.route('/similares/<node_id>', methods=['GET'])
+def lideres_similares(node_id):
+    """Líderes com trajetória (Projetos e Tipos) mais parecida com a de `node_id`; ?k= define quantos."""
+    try:
+        k = int(request.args.get('k', 10))
+    except ValueError:
+        return jsonify({'error': 'O parâmetro k deve ser um número inteiro.'}), 400
+    if k < 1:
+        return jsonify({'error': 'O parâmetro k deve ser maior ou igual a 1.'}), 400
+    try:
+        similares = carregar_indice_similaridade().similares(node_id, k)
+    except FileNotFoundError:
+        return jsonify({'error': f'Arquivo {GEXF_FILE_PATH} não encontrado.'}), 404
+    except KeyError:
+        return jsonify({'error': f'Nó {node_id} não encontrado.'}), 404
+    return jsonify({'id': node_id, 'similares': similares})
+
+@app.route('/top', methods=['GET'])
+def top_metrica():
+    """Top-k de uma métrica (?metrica=&k=), opcionalmente dentro de um Tipo (?tipo=) ou grupo (?grupo=)."""
+    metrica = request.args.get('metrica', 'intermediacao')
+    try:
+        k = int(request.args.get('k', 20))
+    except ValueError:
+        return jsonify({'error': 'O parâmetro k deve ser um número inteiro.'}), 400
+    if k < 1:
+        return jsonify({'error': 'O parâmetro k deve ser maior ou igual a 1.'}), 400
+    tipo = request.args.get('tipo')
+    grupo = request.args.get('grupo')
+    try:
+        ranking = carregar_indice_centralidade().top(metrica, k, tipo=tipo, grupo=grupo)
+    except FileNotFoundError:
+        return jsonify({'error': f'Arquivo {GEXF_FILE_PATH} não encontrado.'}), 404
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except KeyError as e:
+        return jsonify({'error': f'Filtro sem nós: {e.args[0]}'}), 404
+    return jsonify({'metrica': metrica, 'tipo': tipo, 'grupo': grupo, 'top': ranking})
+
+@app.route('/percentil/<node_id>', methods=['GET'])
+def percentil_no(node_id):
+    """Percentis do nó no grafo todo, nos seus Tipos e no seu grupo (?metrica= restringe a uma métrica)."""
+    metricas = ler_lista_parametro(request.args, 'metrica') or None
+    try:
+        percentis = carregar_indice_centralidade().percentis_do_no(node_id, metricas)
+    except FileNotFoundError:
+        return jsonify({'error': f'Arquivo {GEXF_FILE_PATH} não encontrado.'}), 404
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except KeyError:
+        return jsonify({'error': f'Nó {node_id} não encontrado.'}), 404
+    return jsonify({'id': node_id, 'percentis': percentis})
+
 @app.route('/demograficos_genero', methods=['GET'])
 def analise_generos():
     try:
         #Lê arquivo Excel
 
         excel_file_path = 'Redes Lideres Cariocas.xlsx'
+        import pandas as pd  # só as rotas demográficas usam pandas; importado no primeiro uso
         df = pd.read_excel(excel_file_path, sheet_name= 'Base para Demograficos')
         
 
@@ -130,6 +257,7 @@ def analise_projetos_concluidos():
     try:
         #Lê arquivo Excel
         excel_file_path = 'Redes Lideres Cariocas.xlsx'
+        import pandas as pd
         df = pd.read_excel(excel_file_path, sheet_name= 'Base para Demograficos')
         
 
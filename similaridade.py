@@ -0,0 +1,111 @@
+"""
+Recomendação de "líderes similares" com MinHash e índice LSH por bandas.
+
+Cada pessoa é representada pelo conjunto dos seus Projetos e Tipos. No
+carregamento, o índice calcula uma assinatura MinHash por pessoa e a
+distribui em bandas; pessoas que coincidem em alguma banda viram
+candidatas. A consulta só compara (por Jaccard exato) a pessoa
+selecionada com essas candidatas, em vez de percorrer todos os pares.
+"""
+
+import zlib
+from functools import lru_cache
+
+import numpy as np
+
+from grafo_dados import carregar_grafo, ler_snapshot, separar_lista
+
+NUM_PERMUTACOES = 150
+NUM_BANDAS = 50  # 3 linhas por banda: limiar aproximado de Jaccard ~0,27
+PRIMO = (1 << 31) - 1
+SEMENTE = 42
+
+
+def conjunto_caracteristicas(data):
+    """Conjunto de Projetos e Tipos da pessoa, com prefixo para não misturar os dois."""
+    return frozenset(
+        [f'P:{p}' for p in separar_lista(data.get('Projetos', ''))] +
+        [f'T:{t}' for t in separar_lista(data.get('Tipos', ''))]
+    )
+
+
+def jaccard(a, b):
+    """Similaridade de Jaccard exata entre dois conjuntos."""
+    if not a and not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class IndiceSimilaridade:
+    """Assinaturas MinHash e tabela LSH de todas as pessoas do grafo."""
+
+    def __init__(self, G, num_permutacoes=NUM_PERMUTACOES, num_bandas=NUM_BANDAS, semente=SEMENTE):
+        if num_permutacoes % num_bandas:
+            raise ValueError('num_permutacoes deve ser múltiplo de num_bandas.')
+        self.G = G
+        self.linhas_por_banda = num_permutacoes // num_bandas
+        self.conjuntos = {n: conjunto_caracteristicas(d) for n, d in G.nodes(data=True)}
+
+        # Funções de hash (a*x + b) mod PRIMO, uma por permutação
+        rng = np.random.default_rng(semente)
+        a = rng.integers(1, PRIMO, size=num_permutacoes, dtype=np.int64)
+        b = rng.integers(0, PRIMO, size=num_permutacoes, dtype=np.int64)
+
+        self.assinaturas = {}
+        for n, conjunto in self.conjuntos.items():
+            if not conjunto:
+                continue
+            x = np.fromiter((zlib.crc32(c.encode('utf-8')) % PRIMO for c in conjunto),
+                            dtype=np.int64, count=len(conjunto))
+            self.assinaturas[n] = ((np.outer(x, a) + b) % PRIMO).min(axis=0)
+
+        # Baldes por banda: (banda, bytes da fatia da assinatura) -> pessoas
+        self.baldes = {}
+        self.chaves = {}
+        for n, assinatura in self.assinaturas.items():
+            chaves = [
+                (i, assinatura[i * self.linhas_por_banda:(i + 1) * self.linhas_por_banda].tobytes())
+                for i in range(num_bandas)
+            ]
+            self.chaves[n] = chaves
+            for chave in chaves:
+                self.baldes.setdefault(chave, []).append(n)
+
+    def candidatos(self, node_id):
+        """Pessoas que coincidem com `node_id` em pelo menos uma banda."""
+        encontrados = set()
+        for chave in self.chaves.get(node_id, []):
+            encontrados.update(self.baldes[chave])
+        encontrados.discard(node_id)
+        return encontrados
+
+    def _ordenar(self, node_id, pessoas, k):
+        alvo = self.conjuntos[node_id]
+        pontuados = [(jaccard(alvo, self.conjuntos[n]), n) for n in pessoas]
+        pontuados = [(s, n) for s, n in pontuados if s > 0]
+        pontuados.sort(key=lambda item: (-item[0], item[1]))
+        return [
+            {'id': n, 'nome': self.G.nodes[n].get('nome', n), 'jaccard': s}
+            for s, n in pontuados[:max(k, 0)]
+        ]
+
+    def similares(self, node_id, k=10):
+        """Até `k` pessoas mais similares a `node_id`, pelo Jaccard exato entre os candidatos do LSH."""
+        if node_id not in self.conjuntos:
+            raise KeyError(node_id)
+        return self._ordenar(node_id, self.candidatos(node_id), k)
+
+    def similares_forca_bruta(self, node_id, k=10):
+        """Mesma consulta comparando com todas as pessoas (referência para o benchmark)."""
+        if node_id not in self.conjuntos:
+            raise KeyError(node_id)
+        return self._ordenar(node_id, (n for n in self.conjuntos if n != node_id), k)
+
+
+@lru_cache(maxsize=1)
+def carregar_indice_similaridade():
+    """Índice de similaridade do grafo em cache, montado uma vez por processo."""
+    snapshot = ler_snapshot()
+    if snapshot is not None:
+        return snapshot['indice_similaridade']
+    return IndiceSimilaridade(carregar_grafo())
@@ -0,0 +1,45 @@
+# snapshot_grafo.py
+"""
+Gera o snapshot de inicialização usado pelos servidores e pelo app Dash.
+
+O arquivo guarda, em um único pickle, o grafo já com o alcance dos nós,
+o layout do app Dash e os índices temporal, de similaridade e de
+centralidade. Enquanto ele for mais novo que o GEXF, grafo_dados o usa
+no lugar de reler o GEXF e recalcular tudo na inicialização.
+
+Rode de novo sempre que o GEXF mudar:
+    python snapshot_grafo.py
+"""
+
+import pickle
+import time
+
+from grafo_dados import ARQUIVO_SNAPSHOT, GEXF_FILE_PATH, VERSAO_SNAPSHOT, calcular_layout, ler_grafo
+from indices_centralidade import IndiceCentralidade
+from similaridade import IndiceSimilaridade
+from temporal_grafo import IndiceTemporal
+
+
+def gerar_snapshot(gexf_file_path=GEXF_FILE_PATH, arquivo_snapshot=ARQUIVO_SNAPSHOT):
+    """Monta grafo, layout e índices a partir do GEXF e grava o snapshot."""
+    G = ler_grafo(gexf_file_path)
+    indice_temporal = IndiceTemporal(G)
+    indice_temporal.linha_do_tempo()  # já grava as métricas de cada ano no snapshot
+    snapshot = {
+        'versao': VERSAO_SNAPSHOT,
+        'gexf_file_path': gexf_file_path,
+        'grafo': G,
+        'layout': calcular_layout(G),
+        'indice_temporal': indice_temporal,
+        'indice_similaridade': IndiceSimilaridade(G),
+        'indice_centralidade': IndiceCentralidade(G),
+    }
+    with open(arquivo_snapshot, 'wb') as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return snapshot
+
+
+if __name__ == '__main__':
+    inicio = time.perf_counter()
+    gerar_snapshot()
+    print(f"Snapshot gravado em {ARQUIVO_SNAPSHOT} ({time.perf_counter() - inicio:.2f} s)")
@@ -0,0 +1,128 @@
+"""
+Camada temporal do grafo: fatias cumulativas por ano de coorte.
+
+Os nomes dos projetos carregam o ano ("Mentoria 2023 - 6", "ENGAJAMENTO
+MASTER GAMES 2020"). Cada nó é ativado no menor ano entre os seus
+projetos com ano, e cada aresta no menor ano entre os projetos com ano que
+as duas pessoas compartilham, mas nunca antes das duas pontas. Projetos
+sem ano (a maioria dos GTTs) não definem ano; só quem não tem nenhum
+projeto com ano fica na base e aparece em todas as fatias.
+
+O índice de ativação é montado uma vez no carregamento; as fatias
+cumulativas e as métricas de cada ano ficam em cache, então trocar o ano
+no slider ou em /data?ate=<ano> não refiltra o grafo inteiro.
+"""
+
+import re
+from bisect import bisect_right
+from functools import lru_cache
+
+from grafo_dados import carregar_grafo, ler_snapshot, separar_lista
+
+PADRAO_ANO = re.compile(r'\b(19\d{2}|20\d{2})\b')
+
+# Quantidade de nós listados em 'top_intermediacao' na linha do tempo
+TOP_INTERMEDIACAO = 5
+
+
+def ano_do_projeto(projeto):
+    """Ano contido no nome do projeto, ou None se não houver."""
+    achado = PADRAO_ANO.search(projeto)
+    return int(achado.group(1)) if achado else None
+
+
+def _ano_de_ativacao(projetos):
+    """Menor ano entre os projetos com ano; None se nenhum tiver ano (sempre ativo)."""
+    anos = [a for a in (ano_do_projeto(p) for p in projetos) if a is not None]
+    return min(anos) if anos else None
+
+
+def _mais_tardio(*anos):
+    """Maior ano informado, ignorando None (base); None se todos forem base."""
+    anos = [a for a in anos if a is not None]
+    return max(anos) if anos else None
+
+
+class IndiceTemporal:
+    """Índice de ativação de nós e arestas por ano, com fatias cumulativas."""
+
+    def __init__(self, G):
+        self.G = G
+        projetos = {n: set(separar_lista(d.get('Projetos', ''))) for n, d in G.nodes(data=True)}
+
+        ano_do_no = {n: _ano_de_ativacao(proj) for n, proj in projetos.items()}
+        nos_por_ano = {}
+        for n, ano in ano_do_no.items():
+            nos_por_ano.setdefault(ano, []).append(n)
+
+        # A aresta nunca entra antes das duas pontas, mesmo sem projeto em comum
+        arestas_por_ano = {}
+        for u, v in G.edges():
+            ano = _mais_tardio(_ano_de_ativacao(projetos[u] & projetos[v]), ano_do_no[u], ano_do_no[v])
+            arestas_por_ano.setdefault(ano, []).append((u, v))
+
+        # Anos com alguma ativação, em ordem (a base sem ano fica de fora)
+        self.anos = sorted(a for a in set(nos_por_ano) | set(arestas_por_ano) if a is not None)
+
+        # Fatias cumulativas: a base (None) seguida de um acúmulo ano a ano
+        nos = list(nos_por_ano.get(None, []))
+        arestas = list(arestas_por_ano.get(None, []))
+        self._fatia_base = (frozenset(nos), tuple(arestas))
+        self._fatias = []
+        for ano in self.anos:
+            nos.extend(nos_por_ano.get(ano, []))
+            arestas.extend(arestas_por_ano.get(ano, []))
+            self._fatias.append((frozenset(nos), tuple(arestas)))
+
+        self._metricas = {}
+
+    def ano_efetivo(self, ate):
+        """Último ano do índice <= `ate` (None = grafo completo; anterior ao primeiro ano = base)."""
+        if ate is None or not self.anos:
+            return self.anos[-1] if self.anos else None
+        i = bisect_right(self.anos, ate)
+        return self.anos[i - 1] if i else self.anos[0] - 1
+
+    def fatia(self, ate=None):
+        """(nós, arestas) ativos até o ano `ate`, inclusive."""
+        if ate is None:
+            return self._fatias[-1] if self._fatias else self._fatia_base
+        i = bisect_right(self.anos, ate)
+        return self._fatias[i - 1] if i else self._fatia_base
+
+    def metricas(self, ate=None):
+        """Nós, arestas, densidade e maiores intermediações da fatia até `ate` (em cache por ano)."""
+        ano = self.ano_efetivo(ate)
+        if ano not in self._metricas:
+            import networkx as nx
+
+            nos, arestas = self.fatia(ano)
+            H = nx.Graph()
+            H.add_nodes_from(nos)
+            H.add_edges_from((u, v, self.G.edges[u, v]) for u, v in arestas)
+            intermediacao = nx.betweenness_centrality(H) if arestas else {}
+            top = sorted(intermediacao.items(), key=lambda item: item[1], reverse=True)[:TOP_INTERMEDIACAO]
+            self._metricas[ano] = {
+                'ano': ano,
+                'nos': H.number_of_nodes(),
+                'arestas': H.number_of_edges(),
+                'densidade': nx.density(H),
+                'top_intermediacao': [
+                    {'id': n, 'nome': self.G.nodes[n].get('nome', n), 'intermediacao': valor}
+                    for n, valor in top
+                ]
+            }
+        return self._metricas[ano]
+
+    def linha_do_tempo(self):
+        """Métricas cumulativas de cada ano do índice, em ordem."""
+        return [self.metricas(ano) for ano in self.anos]
+
+
+@lru_cache(maxsize=1)
+def carregar_indice_temporal():
+    """Índice temporal do grafo em cache, montado uma vez por processo."""
+    snapshot = ler_snapshot()
+    if snapshot is not None:
+        return snapshot['indice_temporal']
+    return IndiceTemporal(carregar_grafo())